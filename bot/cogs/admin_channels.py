@@ -125,6 +125,10 @@ class AdminChannels(commands.Cog):
                 },
                 upsert=True
             )
+            self.bot.db_manager.invalidate_guild_cache(guild_id)
+
+            if channel_type == 'playercountvc' and self.bot.log_parser is not None:
+                self.bot.log_parser.connection_parser.invalidate_voice_channel_cache(guild_id)
             
             # Create success embed
             embed = discord.Embed(
@@ -218,6 +222,10 @@ class AdminChannels(commands.Cog):
                 {"guild_id": guild_id},
                 {"$set": clear_update}
             )
+            self.bot.db_manager.invalidate_guild_cache(guild_id)
+
+            if self.bot.log_parser is not None:
+                self.bot.log_parser.connection_parser.invalidate_voice_channel_cache(guild_id)
             
             # Create confirmation embed
             embed = discord.Embed(
@@ -3,9 +3,11 @@ Emerald's Killfeed - Parser Management System
 Manage killfeed parsing, log processing, and data collection
 """
 
+import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime, timezone, timedelta
+from typing import Optional, Dict, Any, Tuple
 
 import discord
 from discord.ext import commands
@@ -14,6 +16,9 @@ from discord import Option
 
 logger = logging.getLogger(__name__)
 
+# Seconds to reuse /parser stats counts before querying MongoDB again
+STATS_CACHE_TTL = 60
+
 class Parsers(commands.Cog):
     """
     PARSER MANAGEMENT
@@ -22,8 +27,37 @@ class Parsers(commands.Cog):
     - Data collection status
     """
 
+    # (name, description, inline) for each /parser status field, in display order
+    STATUS_FIELDS = (
+        ("📡 Killfeed Parser", "Monitors live PvP events", True),
+        ("📜 Log Parser", "Processes server log files", True),
+        ("📚 Historical Parser", "Refreshes historical data", True),
+        ("⏰ Background Scheduler", "Manages automated tasks", False),
+    )
+
     def __init__(self, bot):
         self.bot = bot
+        self._stats_cache: Dict[int, Tuple[float, Tuple[int, int, int]]] = {}
+        self._day_start: Optional[datetime] = None
+
+        # Static embed skeletons; commands copy these and fill in the dynamic parts
+        self._status_embed_proto = discord.Embed(
+            title="🔍 Parser Status",
+            description="Current status of all data parsers",
+            color=0x3498DB
+        )
+        for name, description, inline in self.STATUS_FIELDS:
+            self._status_embed_proto.add_field(name=name, value=description, inline=inline)
+        self._status_embed_proto.set_thumbnail(url="attachment://main.png")
+        self._status_embed_proto.set_footer(text="Powered by Discord.gg/EmeraldServers")
+
+        self._stats_embed_proto = discord.Embed(
+            title="📊 Parser Statistics",
+            description="Performance metrics for data parsers",
+            color=0x9B59B6
+        )
+        self._stats_embed_proto.set_thumbnail(url="attachment://main.png")
+        self._stats_embed_proto.set_footer(text="Powered by Discord.gg/EmeraldServers")
 
     # Create subcommand group using SlashCommandGroup
     parser = discord.SlashCommandGroup("parser", "Parser management commands")
@@ -32,50 +66,22 @@ class Parsers(commands.Cog):
     async def parser_status(self, ctx: discord.ApplicationContext):
         """Check the status of all parsers"""
         try:
-            embed = discord.Embed(
-                title="🔍 Parser Status",
-                description="Current status of all data parsers",
-                color=0x3498DB,
-                timestamp=datetime.now(timezone.utc)
+            embed = self._status_embed_proto.copy()
+            embed.timestamp = datetime.now(timezone.utc)
+
+            statuses = (
+                # Killfeed parser status
+                "🟢 Active" if self.bot.killfeed_parser is not None else "🔴 Inactive",
+                # Log parser status
+                "🟢 Active" if self.bot.log_parser is not None else "🔴 Inactive",
+                # Historical parser status
+                "🟢 Active" if self.bot.historical_parser is not None else "🔴 Inactive",
+                # Scheduler status
+                "🟢 Running" if self.bot.scheduler.running else "🔴 Stopped",
             )
 
-            # Killfeed parser status
-            killfeed_status = "🟢 Active" if hasattr(self.bot, 'killfeed_parser') and self.bot.killfeed_parser else "🔴 Inactive"
-
-            # Log parser status
-            log_status = "🟢 Active" if hasattr(self.bot, 'log_parser') and self.bot.log_parser else "🔴 Inactive"
-
-            # Historical parser status
-            historical_status = "🟢 Active" if hasattr(self.bot, 'historical_parser') and self.bot.historical_parser else "🔴 Inactive"
-
-            embed.add_field(
-                name="📡 Killfeed Parser",
-                value=f"Status: **{killfeed_status}**\nMonitors live PvP events",
-                inline=True
-            )
-
-            embed.add_field(
-                name="📜 Log Parser",
-                value=f"Status: **{log_status}**\nProcesses server log files",
-                inline=True
-            )
-
-            embed.add_field(
-                name="📚 Historical Parser",
-                value=f"Status: **{historical_status}**\nRefreshes historical data",
-                inline=True
-            )
-
-            # Scheduler status
-            scheduler_status = "🟢 Running" if self.bot.scheduler.running else "🔴 Stopped"
-            embed.add_field(
-                name="⏰ Background Scheduler",
-                value=f"Status: **{scheduler_status}**\nManages automated tasks",
-                inline=False
-            )
-
-            embed.set_thumbnail(url="attachment://main.png")
-            embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
+            for index, ((name, description, inline), status) in enumerate(zip(self.STATUS_FIELDS, statuses)):
+                embed.set_field_at(index, name=name, value=f"Status: **{status}**\n{description}", inline=inline)
 
             await ctx.respond(embed=embed)
 
@@ -102,24 +108,17 @@ class Parsers(commands.Cog):
                 return
 
             # Find the server - now using server ID from autocomplete
-            servers = guild_config.get('servers', [])
-            server_found = False
-            server_name = "Unknown"
-            for srv in servers:
-                if str(srv.get('_id')) == server:
-                    server_found = True
-                    server_name = srv.get('name', 'Unknown')
-                    break
-
-            if not server_found:
+            srv = await self.bot.db_manager.get_guild_server(guild_id, server)
+            if not srv:
                 await ctx.respond(f"❌ Server not found in this guild!", ephemeral=True)
                 return
+            server_name = srv.get('name', 'Unknown')
 
             # Defer response for potentially long operation
             await ctx.defer()
 
             # Trigger historical refresh if parser is available
-            if hasattr(self.bot, 'historical_parser') and self.bot.historical_parser:
+            if self.bot.historical_parser is not None:
                 try:
                     await self.bot.historical_parser.refresh_historical_data(guild_id, server)
 
@@ -156,36 +155,64 @@ class Parsers(commands.Cog):
             logger.error(f"Failed to refresh parser data: {e}")
             await ctx.respond("❌ Failed to initiate data refresh.", ephemeral=True)
 
+    def _utc_day_start(self) -> datetime:
+        """Midnight UTC today; the same instance is reused until the day rolls over"""
+        now = datetime.now(timezone.utc)
+        if self._day_start is None or now - self._day_start >= timedelta(days=1):
+            self._day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        return self._day_start
+
+    async def _get_parser_counts(self, guild_id: int) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """Return (kills today, players tracked, linked users), cached briefly per guild
+
+        A count that fails is returned as None without discarding the others.
+        """
+        cached = self._stats_cache.get(guild_id)
+        if cached and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return cached[1]
+
+        db = self.bot.db_manager
+        results = await asyncio.gather(
+            # Count kill events since midnight UTC
+            db.kill_events.count_documents({
+                'guild_id': guild_id,
+                'timestamp': {'$gte': self._utc_day_start()}
+            }, hint=[('guild_id', 1), ('timestamp', -1)]),
+            # Count total players tracked
+            db.pvp_data.count_documents({'guild_id': guild_id}),
+            # Count linked players
+            db.players.count_documents({'guild_id': guild_id}),
+            return_exceptions=True
+        )
+
+        counts = []
+        for label, result in zip(('kill events', 'tracked players', 'linked players'), results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to count {label} for guild {guild_id}: {result}")
+                counts.append(None)
+            else:
+                counts.append(result)
+        counts = tuple(counts)
+
+        # Only cache complete results so a transient failure is retried next call
+        if None not in counts:
+            self._stats_cache[guild_id] = (time.monotonic(), counts)
+        return counts
+
     @parser.command(name="stats", description="Show parser statistics")
     async def parser_stats(self, ctx: discord.ApplicationContext):
         """Display parser performance statistics"""
         try:
             guild_id = ctx.guild.id
 
-            embed = discord.Embed(
-                title="📊 Parser Statistics",
-                description="Performance metrics for data parsers",
-                color=0x9B59B6,
-                timestamp=datetime.now(timezone.utc)
-            )
+            embed = self._stats_embed_proto.copy()
+            embed.timestamp = datetime.now(timezone.utc)
 
             # Get recent parsing stats from database - fixed database calls
             try:
-                # Count recent killfeed entries (last 24 hours)
-                recent_kills = await self.bot.db_manager.killfeed.count_documents({
-                    'guild_id': guild_id,
-                    'timestamp': {'$gte': datetime.now(timezone.utc).replace(hour=0, minute=0, second=0)}
-                })
-
-                # Count total players tracked
-                total_players = await self.bot.db_manager.pvp_data.count_documents({
-                    'guild_id': guild_id
-                })
-
-                # Count linked players
-                linked_players = await self.bot.db_manager.players.count_documents({
-                    'guild_id': guild_id
-                })
+                recent_kills, total_players, linked_players = (
+                    'N/A' if count is None else count for count in await self._get_parser_counts(guild_id)
+                )
 
                 embed.add_field(
                     name="📈 Today's Activity",
@@ -209,9 +236,6 @@ class Parsers(commands.Cog):
                     inline=False
                 )
 
-            embed.set_thumbnail(url="attachment://main.png")
-            embed.set_footer(text="Powered by Discord.gg/EmeraldServers")
-
             await ctx.respond(embed=embed)
 
         except Exception as e:
@@ -252,7 +276,7 @@ class Parsers(commands.Cog):
         await ctx.defer()
 
         try:
-            if not hasattr(self.bot, 'log_parser'):
+            if self.bot.log_parser is None:
                 await ctx.respond("❌ Log parser not initialized", ephemeral=True)
                 return
 
@@ -302,7 +326,7 @@ class Parsers(commands.Cog):
         await ctx.defer()
 
         try:
-            if not hasattr(self.bot, 'log_parser'):
+            if self.bot.log_parser is None:
                 await ctx.followup.send("❌ Log parser not initialized")
                 return
 
@@ -320,7 +344,7 @@ class Parsers(commands.Cog):
         await ctx.defer()
 
         try:
-            if not hasattr(self.bot, 'log_parser'):
+            if self.bot.log_parser is None:
                 await ctx.followup.send("❌ Log parser not initialized")
                 return
 
@@ -68,6 +68,7 @@ class Premium(commands.Cog):
                 {"guild_id": {"$ne": guild_id}},
                 {"$unset": {"is_home_server": ""}}
             )
+            self.bot.database.invalidate_guild_cache()
 
             embed = discord.Embed(
                 title="🏠 Home Server Set",
@@ -405,7 +406,7 @@ class Premium(commands.Cog):
 
             # Schedule automatic refresh of server data
             try:
-                if hasattr(self.bot, 'historical_parser'):
+                if self.bot.historical_parser is not None:
                     await self.bot.historical_parser.auto_refresh_after_server_add(guild_id, server_config)
             except Exception as e:
                 logger.error(f"Failed to schedule automatic refresh: {e}")
@@ -634,7 +635,7 @@ class Premium(commands.Cog):
             await ctx.respond(f"⏳ Starting data refresh for server **{server_name}**...")
             
             # Verify we have the historical parser
-            if not hasattr(self.bot, 'historical_parser'):
+            if self.bot.historical_parser is None:
                 await ctx.followup.send("❌ Historical parser is not available!")
                 return
                 
@@ -6,13 +6,17 @@ Implements PHASE 1 data architecture requirements
 
 import logging
 import asyncio
-from typing import Optional, Dict, List, Any
+import time
+from typing import Optional, Dict, List, Any, Tuple
 from datetime import datetime, timezone, timedelta
 from motor.motor_asyncio import AsyncIOMotorClient
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 logger = logging.getLogger(__name__)
 
+# Seconds a guild config fetched by get_guild is served from memory
+GUILD_CACHE_TTL = 30
+
 class DatabaseManager:
     """
     Database manager implementing PHASE 1 architecture:
@@ -36,8 +40,17 @@ class DatabaseManager:
         self.kill_events = self.db.kill_events
         self.premium = self.db.premium_servers
 
+        # guild_id -> (fetched_at, guild config, servers keyed by str(_id)); see get_guild
+        self._guild_cache: Dict[int, Tuple[float, Dict[str, Any], Dict[str, Dict[str, Any]]]] = {}
+
     async def initialize_indexes(self):
-        """Create database indexes for optimal performance"""
+        """Create database indexes for optimal performance
+
+        count_documents() is an aggregation; it only takes the fast COUNT_SCAN path
+        when an index prefix matches the filter, otherwise it scans the collection.
+        Guild-wide counts on players and pvp_data are served by the guild_id prefix
+        of their compound indexes, so no separate single-field indexes are needed.
+        """
         try:
             # Guild indexes
             await self.guilds.create_index("guild_id", unique=True)
@@ -55,6 +68,8 @@ class DatabaseManager:
             await self.kill_events.create_index([("guild_id", 1), ("server_id", 1), ("timestamp", -1)])
             await self.kill_events.create_index([("guild_id", 1), ("server_id", 1), ("killer", 1)])
             await self.kill_events.create_index([("guild_id", 1), ("server_id", 1), ("victim", 1)])
+            # Guild-wide range on timestamp (/parser stats daily count, hinted there)
+            await self.kill_events.create_index([("guild_id", 1), ("timestamp", -1)])
 
             # Economy indexes (guild-scoped)
             await self.economy.create_index([("guild_id", 1), ("discord_id", 1)], unique=True)
@@ -106,17 +121,48 @@ class DatabaseManager:
         }
 
         await self.guilds.insert_one(guild_doc)
+        self.invalidate_guild_cache(guild_id)
         logger.info(f"Created guild: {guild_name} ({guild_id})")
         return guild_doc
 
     async def get_guild(self, guild_id: int) -> Optional[Dict[str, Any]]:
-        """Get guild configuration"""
+        """Get guild configuration (cached for GUILD_CACHE_TTL seconds, treat as read-only)"""
+        entry = await self._get_cached_guild(guild_id)
+        return entry[1] if entry else None
+
+    async def get_guild_server(self, guild_id: int, server_id: str) -> Optional[Dict[str, Any]]:
+        """Get a server config from the guild by its stringified _id"""
+        entry = await self._get_cached_guild(guild_id)
+        return entry[2].get(str(server_id)) if entry else None
+
+    async def _get_cached_guild(self, guild_id: int) -> Optional[Tuple[float, Dict[str, Any], Dict[str, Dict[str, Any]]]]:
+        """Return the cache entry for a guild, fetching it when missing or expired"""
+        cached = self._guild_cache.get(guild_id)
+        if cached and time.monotonic() - cached[0] < GUILD_CACHE_TTL:
+            return cached
+
         try:
-            return await self.guilds.find_one({"guild_id": guild_id})
+            guild_doc = await self.guilds.find_one({"guild_id": guild_id})
         except Exception as e:
             logger.error(f"Failed to get guild {guild_id}: {e}")
             return None
 
+        if guild_doc is None:
+            return None
+
+        # Iterate in reverse so the first server with a given _id wins, as a linear scan would
+        servers_by_id = {str(srv.get('_id')): srv for srv in reversed(guild_doc.get('servers', []))}
+        entry = (time.monotonic(), guild_doc, servers_by_id)
+        self._guild_cache[guild_id] = entry
+        return entry
+
+    def invalidate_guild_cache(self, guild_id: Optional[int] = None):
+        """Drop cached guild config after a write (all guilds if guild_id is None)"""
+        if guild_id is None:
+            self._guild_cache.clear()
+        else:
+            self._guild_cache.pop(guild_id, None)
+
     async def add_server_to_guild(self, guild_id: int, server_config: Dict[str, Any]) -> bool:
         """Add game server to guild"""
         try:
@@ -124,6 +170,7 @@ class DatabaseManager:
                 {"guild_id": guild_id},
                 {"$addToSet": {"servers": server_config}}
             )
+            self.invalidate_guild_cache(guild_id)
             return result.modified_count > 0
         except Exception as e:
             logger.error(f"Failed to add server to guild {guild_id}: {e}")
@@ -145,6 +192,7 @@ class DatabaseManager:
                     {"$pull": {"servers": {"server_id": server_id}}}
                 )
 
+            self.invalidate_guild_cache(guild_id)
             return result.modified_count > 0
         except Exception as e:
             logger.error(f"Failed to remove server from guild {guild_id}: {e}")
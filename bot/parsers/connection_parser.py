@@ -6,13 +6,78 @@ Complete rebuild implementing 4-event lifecycle tracking with live counts
 import asyncio
 import logging
 import re
+import time
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Tuple
 import discord
 from bot.utils.embed_factory import EmbedFactory
 
 logger = logging.getLogger(__name__)
 
+# Lines classified per worker-thread hop in parse_lines
+LIFECYCLE_BATCH_SIZE = 1000
+
+# Player lifecycle states; values >= PLAYER_LEFT_PRE are terminal
+PLAYER_QUEUED = 1
+PLAYER_JOINED = 2
+PLAYER_LEFT_PRE = 3
+PLAYER_LEFT_POST = 4
+
+# Lifecycle events applied per server between prunes of finished players
+PLAYER_GC_INTERVAL = 500
+
+# Most players tracked per server; the least recently seen are evicted beyond this
+MAX_TRACKED_PLAYERS = 10000
+
+# Seconds without lifecycle events before a server's tracking state is dropped
+SERVER_TRACKING_TTL = 86400
+
+# Seconds between voice channel renames; Discord allows ~2 channel edits per 10 minutes
+VOICE_CHANNEL_FLUSH_INTERVAL = 300
+
+# Compile robust regex patterns for the 4 lifecycle events once, at import.
+# Unreal emits these lines with fixed case, so IGNORECASE is left off to keep
+# sre's literal-prefix fast path.
+LIFECYCLE_PATTERNS: Dict[str, re.Pattern] = {
+    # 1. Queue Join (jq) - Player enters queue
+    'queue_join': re.compile(
+        r'LogNet: Join request: /Game/Maps/world_0/World_0\?.*\?Name=([^&\s]+).*(?:platformid=PS5:(\w+)|eosid=\|(\w+))'
+    ),
+
+    # 2. Player Joined (j2) - Player successfully registered
+    'player_joined': re.compile(
+        r'LogOnline: Warning: Player \|(\w+) successfully registered!'
+    ),
+
+    # 3. Disconnect Post-Join (d1) - Standard disconnect after joining
+    'disconnect_post_join': re.compile(
+        r'UChannel::Close: Sending CloseBunch.*UniqueId: EOS:\|(\w+)'
+    ),
+
+    # 4. Disconnect Pre-Join (d2) - Disconnect from queue before joining
+    'disconnect_pre_join': re.compile(
+        r'UChannel::Close: Sending CloseBunch.*UniqueId: (?:PS5|EOS):\|?(\w+)'
+    )
+}
+
+def _build_alternation(*names: str) -> re.Pattern:
+    """Join lifecycle patterns into one regex with a named group per event"""
+    return re.compile(
+        '|'.join(f'(?P<{name}>{LIFECYCLE_PATTERNS[name].pattern})' for name in names)
+    )
+
+# Each lifecycle event family carries a fixed marker; route a line to the one
+# regex for its family so at most one pattern is scanned per line.
+# Within a family, branch order keeps post-join ahead of pre-join.
+# The marker test is already a C-level substring scan, and capture groups are
+# still needed for IDs, so a DFA engine (re2/hyperscan) would not pay off here.
+ROUTED_LIFECYCLE_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ('Join request:', _build_alternation('queue_join')),
+    ('successfully registered', _build_alternation('player_joined')),
+    ('CloseBunch', _build_alternation('disconnect_post_join', 'disconnect_pre_join')),
+]
+
 class ConnectionLifecycleParser:
     """
     PLAYER CONNECTION + COUNT SYSTEM - Complete Rebuild
@@ -20,14 +85,36 @@ class ConnectionLifecycleParser:
     Maintains live counts: QC = jq - j2 - d2, PC = j2 - d1
     """
 
+    __slots__ = (
+        'bot', 'server_counts', 'player_states', 'event_counters', '_last_activity', 'player_names',
+        'recent_connections', 'recent_disconnections',
+        '_pending_counts', '_vc_dirty', '_vc_worker_task', '_vc_cache',
+    )
+
+    # Shared, compiled once at import
+    lifecycle_patterns = LIFECYCLE_PATTERNS
+    _routed_patterns = ROUTED_LIFECYCLE_PATTERNS
+
+    # Connection event -> (EmbedFactory embed type, result type)
+    CONNECTION_EMBEDS = {
+        'join': ('player_join', 'player_connection'),
+        'leave': ('player_leave', 'player_disconnection'),
+    }
+
     def __init__(self, bot):
         self.bot = bot
         
         # Live count tracking per server
         self.server_counts: Dict[str, Dict[str, Any]] = {}
         
-        # Player state tracking per server  
-        self.player_states: Dict[str, Dict[str, Set[str]]] = {}
+        # Player state tracking per server (player_id -> PLAYER_* state, least recent first)
+        self.player_states: Dict[str, OrderedDict] = {}
+
+        # Lifecycle transition counters per server (jq, j2, d1, d2)
+        self.event_counters: Dict[str, Dict[str, int]] = {}
+
+        # Monotonic time of the last lifecycle event per server (drives idle expiry)
+        self._last_activity: Dict[str, float] = {}
         
         # Player ID to name mapping cache per server
         self.player_names: Dict[str, Dict[str, str]] = {}
@@ -35,33 +122,15 @@ class ConnectionLifecycleParser:
         # Track recent connection messages to prevent duplicates (server_key -> player_id -> timestamp)
         self.recent_connections: Dict[str, Dict[str, float]] = {}
         self.recent_disconnections: Dict[str, Dict[str, float]] = {}
-        
-        # Compile robust regex patterns for the 4 lifecycle events
-        self.lifecycle_patterns = {
-            # 1. Queue Join (jq) - Player enters queue
-            'queue_join': re.compile(
-                r'LogNet: Join request: /Game/Maps/world_0/World_0\?.*\?Name=([^&\s]+).*(?:platformid=PS5:(\w+)|eosid=\|(\w+))', 
-                re.IGNORECASE
-            ),
-            
-            # 2. Player Joined (j2) - Player successfully registered
-            'player_joined': re.compile(
-                r'LogOnline: Warning: Player \|(\w+) successfully registered!', 
-                re.IGNORECASE
-            ),
-            
-            # 3. Disconnect Post-Join (d1) - Standard disconnect after joining
-            'disconnect_post_join': re.compile(
-                r'UChannel::Close: Sending CloseBunch.*UniqueId: EOS:\|(\w+)', 
-                re.IGNORECASE
-            ),
-            
-            # 4. Disconnect Pre-Join (d2) - Disconnect from queue before joining
-            'disconnect_pre_join': re.compile(
-                r'UChannel::Close: Sending CloseBunch.*UniqueId: (?:PS5|EOS):\|?(\w+)', 
-                re.IGNORECASE
-            )
-        }
+
+        # Latest (player_count, queue_count) per server awaiting a voice channel rename,
+        # drained by a single background worker
+        self._pending_counts: Dict[str, Tuple[int, int]] = {}
+        self._vc_dirty = asyncio.Event()
+        self._vc_worker_task: Optional[asyncio.Task] = None
+
+        # Resolved (voice_channel_id, server_name) per server for player count renames
+        self._vc_cache: Dict[str, Tuple[int, str]] = {}
 
     def initialize_server_tracking(self, server_key: str):
         """Initialize tracking structures for a server"""
@@ -72,116 +141,244 @@ class ConnectionLifecycleParser:
             }
             
         if server_key not in self.player_states:
-            self.player_states[server_key] = {
-                'players_queued': set(),      # Players in queue (jq)
-                'players_joined': set(),      # Players who joined (j2)
-                'players_disconnected_pre': set(),   # Players who disconnected from queue (d2)
-                'players_disconnected_post': set()   # Players who disconnected after joining (d1)
+            self.player_states[server_key] = OrderedDict()  # player_id -> PLAYER_* state, LRU order
+            self.event_counters[server_key] = {
+                'jq': 0,  # Queue joins
+                'j2': 0,  # Successful joins
+                'd1': 0,  # Disconnects after joining
+                'd2': 0,  # Disconnects from queue
+                'events': 0,  # Lifecycle events applied (drives pruning)
             }
 
     async def parse_lifecycle_event(self, line: str, server_key: str, guild_id: int) -> Optional[Dict[str, Any]]:
         """Parse a single log line for lifecycle events"""
+        return await self._apply_lifecycle_event(self._classify(line), server_key)
+
+    async def parse_lines(self, lines: List[str], server_key: str, guild_id: int) -> List[Optional[Dict[str, Any]]]:
+        """Parse a batch of log lines, returning one result per line.
+
+        Regex classification runs in a worker thread so long logs do not block the
+        event loop; state updates, embeds and channel edits stay on the loop.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        for i in range(0, len(lines), LIFECYCLE_BATCH_SIZE):
+            chunk = lines[i:i + LIFECYCLE_BATCH_SIZE]
+            classified = await asyncio.to_thread(self._classify_batch, chunk)
+            for event in classified:
+                results.append(await self._apply_lifecycle_event(event, server_key) if event else None)
+        return results
+
+    def _classify_batch(self, lines: List[str]) -> List[Optional[Tuple[str, str, Optional[str]]]]:
+        """Classify a batch of lines (thread-safe, no state access)
+
+        Markers are located with str.find over the joined chunk, so only lines that
+        contain one are visited from Python.
+        """
+        results: List[Optional[Tuple[str, str, Optional[str]]]] = [None] * len(lines)
+        buffer = '\n'.join(lines)
+
+        offsets = []
+        for marker, _ in self._routed_patterns:
+            pos = buffer.find(marker)
+            while pos != -1:
+                offsets.append(pos)
+                pos = buffer.find(marker, pos + 1)
+        offsets.sort()
+
+        # Walk hits in order, turning buffer offsets into line indexes
+        line_index, scanned_to, last_classified = 0, 0, -1
+        for offset in offsets:
+            line_index += buffer.count('\n', scanned_to, offset)
+            scanned_to = offset
+            if line_index != last_classified:
+                results[line_index] = self._classify(lines[line_index])
+                last_classified = line_index
+        return results
+
+    def _classify(self, line: str) -> Optional[Tuple[str, str, Optional[str]]]:
+        """Classify a line as (event, player_id, player_name) without touching state"""
+        # Nearly all log lines carry none of the markers and never reach a regex
+        for marker, pattern in self._routed_patterns:
+            if marker in line:
+                match = pattern.search(line)
+                break
+        else:
+            return None
+
+        if not match:
+            return None
+
+        # lastgroup names the matched branch; its capture groups follow lastindex
+        matched = match.lastgroup
+        base = match.lastindex
+
+        if matched == 'queue_join':
+            player_id = match.group(base + 2) or match.group(base + 3)  # PS5 or EOS ID
+            if not player_id:
+                return None
+            return matched, player_id, match.group(base + 1)
+
+        player_id = match.group(base + 1)
+        if matched == 'disconnect_pre_join':
+            return matched, player_id, None
+
+        # Try to extract player name from the current line
+        return matched, player_id, self._extract_player_name_from_log_line(line, player_id)
+
+    async def _apply_lifecycle_event(self, event: Optional[Tuple[str, str, Optional[str]]], server_key: str) -> Optional[Dict[str, Any]]:
+        """Apply a classified lifecycle event to the tracked server state"""
+        if not event:
+            return None
+
+        matched, player_id, player_name = event
         self.initialize_server_tracking(server_key)
-        
-        # Extract player ID from the line for tracking
-        player_id = None
-        event_type = None
-        player_name = None
-        
-        # Check for Queue Join (jq)
-        if match := self.lifecycle_patterns['queue_join'].search(line):
-            player_name = match.group(1)
-            player_id = match.group(2) or match.group(3)  # PS5 or EOS ID
-            event_type = 'jq'
-            
-            if player_id:
-                # Cache the player name if we have it
-                if player_name:
-                    await self._cache_player_name(server_key, player_id, player_name)
-                
-                self.player_states[server_key]['players_queued'].add(player_id)
-                await self._update_live_counts(server_key)
-                logger.info(f"🟡 Queue Join: {player_name} ({player_id}) joined queue")
-        
-        # Check for Player Joined (j2)
-        elif match := self.lifecycle_patterns['player_joined'].search(line):
-            player_id = match.group(1)
-            event_type = 'j2'
-            
-            self.player_states[server_key]['players_joined'].add(player_id)
-            await self._update_live_counts(server_key)
-            
-            # Try to extract player name from the current line or previous context
-            extracted_name = self._extract_player_name_from_log_line(line, player_id)
-            if extracted_name:
-                await self._cache_player_name(server_key, player_id, extracted_name)
-            
-            logger.info(f"🟢 Player Joined: {player_id} successfully registered")
-            
+        states = self.player_states[server_key]
+        counters = self.event_counters[server_key]
+        state = states.get(player_id)
+        result = None
+
+        # Queue Join (jq)
+        if matched == 'queue_join':
+            # Cache the player name if we have it
+            if player_name:
+                await self._cache_player_name(server_key, player_id, player_name)
+
+            if state != PLAYER_QUEUED and state != PLAYER_JOINED:
+                self._set_player_state(server_key, player_id, PLAYER_QUEUED)
+                counters['jq'] += 1
+                self._update_live_counts(server_key)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🟡 Queue Join: {player_name} ({player_id}) joined queue")
+
+        # Player Joined (j2)
+        elif matched == 'player_joined':
+            if state != PLAYER_JOINED:
+                self._set_player_state(server_key, player_id, PLAYER_JOINED)
+                counters['j2'] += 1
+                self._update_live_counts(server_key)
+
+            if player_name:
+                await self._cache_player_name(server_key, player_id, player_name)
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🟢 Player Joined: {player_id} successfully registered")
+
             # Create join embed with resolved name
-            return await self._create_join_embed(player_id, extracted_name, server_key)
-        
-        # Check for Disconnect (d1 or d2)
-        elif match := self.lifecycle_patterns['disconnect_post_join'].search(line):
-            player_id = match.group(1)
-            
+            result = await self._create_join_embed(player_id, player_name, server_key)
+
+        # Disconnect (d1 or d2)
+        elif matched == 'disconnect_post_join':
             # Determine if this is d1 (post-join) or d2 (pre-join)
-            if player_id in self.player_states[server_key]['players_joined']:
-                event_type = 'd1'
-                self.player_states[server_key]['players_disconnected_post'].add(player_id)
-                logger.info(f"🔴 Post-Join Disconnect: {player_id} left after joining")
-                
-                # Try to extract player name from the current line
-                extracted_name = self._extract_player_name_from_log_line(line, player_id)
-                if extracted_name:
-                    await self._cache_player_name(server_key, player_id, extracted_name)
-                
+            if state == PLAYER_JOINED:
+                self._set_player_state(server_key, player_id, PLAYER_LEFT_POST)
+                counters['d1'] += 1
+                self._update_live_counts(server_key)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🔴 Post-Join Disconnect: {player_id} left after joining")
+
+                if player_name:
+                    await self._cache_player_name(server_key, player_id, player_name)
+
                 # Create leave embed with resolved name
-                return await self._create_leave_embed(player_id, extracted_name, server_key)
-                
-            elif player_id in self.player_states[server_key]['players_queued']:
-                event_type = 'd2'
-                self.player_states[server_key]['players_disconnected_pre'].add(player_id)
-                logger.info(f"🟠 Pre-Join Disconnect: {player_id} left queue before joining")
-            
-            await self._update_live_counts(server_key)
-        
-        # Check for Pre-Join Disconnect (d2 alternative pattern)
-        elif match := self.lifecycle_patterns['disconnect_pre_join'].search(line):
-            player_id = match.group(1)
-            
+                result = await self._create_leave_embed(player_id, player_name, server_key)
+
+            elif state == PLAYER_QUEUED:
+                self._set_player_state(server_key, player_id, PLAYER_LEFT_PRE)
+                counters['d2'] += 1
+                self._update_live_counts(server_key)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🟠 Pre-Join Disconnect: {player_id} left queue before joining")
+
+        # Pre-Join Disconnect (d2 alternative pattern)
+        elif matched == 'disconnect_pre_join':
             # Only count as d2 if player was in queue but never joined
-            if (player_id in self.player_states[server_key]['players_queued'] and 
-                player_id not in self.player_states[server_key]['players_joined']):
-                event_type = 'd2'
-                self.player_states[server_key]['players_disconnected_pre'].add(player_id)
-                await self._update_live_counts(server_key)
-                logger.info(f"🟠 Pre-Join Disconnect: {player_id} left queue before joining")
-        
-        return None
+            if state == PLAYER_QUEUED:
+                self._set_player_state(server_key, player_id, PLAYER_LEFT_PRE)
+                counters['d2'] += 1
+                self._update_live_counts(server_key)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"🟠 Pre-Join Disconnect: {player_id} left queue before joining")
 
-    async def _update_live_counts(self, server_key: str):
-        """Update live player and queue counts using the formulas"""
+        self._last_activity[server_key] = time.monotonic()
+        counters['events'] += 1
+        if counters['events'] % PLAYER_GC_INTERVAL == 0:
+            self._prune_finished_players(server_key)
+            self._expire_idle_servers()
+
+        return result
+
+    def _set_player_state(self, server_key: str, player_id: str, state: int):
+        """Record a player's state as most recently seen, evicting beyond MAX_TRACKED_PLAYERS"""
+        states = self.player_states[server_key]
+        states[player_id] = state
+        states.move_to_end(player_id)
+
+        if len(states) > MAX_TRACKED_PLAYERS:
+            # Count an evicted in-progress session as a disconnect so live counts stay balanced
+            evicted_id, evicted_state = states.popitem(last=False)
+            if evicted_state == PLAYER_QUEUED:
+                self.event_counters[server_key]['d2'] += 1
+            elif evicted_state == PLAYER_JOINED:
+                self.event_counters[server_key]['d1'] += 1
+            logger.debug(f"Evicted least recently seen player {evicted_id} for server {server_key}")
+
+    def _expire_idle_servers(self):
+        """Drop tracking state for servers with no lifecycle events within SERVER_TRACKING_TTL"""
+        cutoff = time.monotonic() - SERVER_TRACKING_TTL
+        for server_key in [key for key, seen in self._last_activity.items() if seen < cutoff]:
+            self.reset_server_counts(server_key)
+
+    def _prune_finished_players(self, server_key: str):
+        """Drop players whose session has ended; counters already account for them"""
         states = self.player_states[server_key]
+        finished = [pid for pid, state in states.items() if state >= PLAYER_LEFT_PRE]
+        for pid in finished:
+            del states[pid]
+        if finished:
+            logger.debug(f"Pruned {len(finished)} finished players for server {server_key}")
+
+    def _update_live_counts(self, server_key: str):
+        """Update live player and queue counts using the formulas"""
+        counters = self.event_counters[server_key]
         counts = self.server_counts[server_key]
         
         # QC (Queue Count) = jq - j2 - d2
-        jq = len(states['players_queued'])
-        j2 = len(states['players_joined']) 
-        d2 = len(states['players_disconnected_pre'])
-        queue_count = max(0, jq - j2 - d2)
+        queue_count = max(0, counters['jq'] - counters['j2'] - counters['d2'])
         
         # PC (Player Count) = j2 - d1
-        d1 = len(states['players_disconnected_post'])
-        player_count = max(0, j2 - d1)
+        player_count = max(0, counters['j2'] - counters['d1'])
         
+        if counts['queue_count'] == queue_count and counts['player_count'] == player_count:
+            return
+
         counts['queue_count'] = queue_count
         counts['player_count'] = player_count
         
-        logger.info(f"📊 Live Counts - Players: {player_count}, Queue: {queue_count}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📊 Live Counts - Players: {player_count}, Queue: {queue_count}")
         
-        # Update voice channels with new counts
-        await self._update_voice_channels(server_key, player_count, queue_count)
+        # Hand the rename to the background worker; it applies only the latest counts
+        self._schedule_voice_channel_update(server_key, player_count, queue_count)
+
+    def _schedule_voice_channel_update(self, server_key: str, player_count: int, queue_count: int):
+        """Post the latest counts for a server to the voice channel worker.
+
+        Only the newest snapshot per server is kept, so parsing never waits on Discord.
+        """
+        self._pending_counts[server_key] = (player_count, queue_count)
+        self._vc_dirty.set()
+        if self._vc_worker_task is None or self._vc_worker_task.done():
+            self._vc_worker_task = asyncio.create_task(self._voice_channel_worker())
+
+    async def _voice_channel_worker(self):
+        """Apply pending voice channel renames, then wait out the flush interval"""
+        while True:
+            await self._vc_dirty.wait()
+            self._vc_dirty.clear()
+            pending, self._pending_counts = self._pending_counts, {}
+            for server_key, (player_count, queue_count) in pending.items():
+                await self._update_voice_channels(server_key, player_count, queue_count)
+            await asyncio.sleep(VOICE_CHANNEL_FLUSH_INTERVAL)
 
     async def _update_voice_channels(self, server_key: str, player_count: int, queue_count: int):
         """Update voice channel names with current player and queue counts"""
@@ -195,36 +392,21 @@ class ConnectionLifecycleParser:
             if not guild:
                 return
 
-            # Get guild configuration to find the configured playercountvc channel
-            if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
-                logger.warning("Bot database not available for voice channel update")
-                return
-
-            guild_config = await self.bot.db_manager.get_guild(guild_id)
-            if not guild_config:
-                return
-
-            # Look for playercountvc channel (set by /setchannel playercountvc command)
-            channels = guild_config.get('channels', {})
-            voice_channel_id = channels.get('playercountvc')
-
-            if not voice_channel_id:
-                logger.debug(f"No playercountvc channel configured for guild {guild_id}")
-                return
+            # Resolve the target channel from guild config once, then reuse it
+            target = self._vc_cache.get(server_key)
+            if target is None:
+                target = await self._resolve_voice_channel_target(guild_id, server_id)
+                if target is None:
+                    return
+                self._vc_cache[server_key] = target
 
+            voice_channel_id, server_name = target
             voice_channel = guild.get_channel(voice_channel_id)
             if not voice_channel:
                 logger.warning(f"Voice channel {voice_channel_id} not found for guild {guild_id}")
+                self._vc_cache.pop(server_key, None)
                 return
 
-            # Get server name from guild config
-            servers = guild_config.get('servers', [])
-            server_name = 'Unknown Server'
-            for server_config in servers:
-                if str(server_config.get('_id', '')) == server_id:
-                    server_name = server_config.get('name', f'Server {server_id}')
-                    break
-
             # Format: "📈 ServerName: players/max (queue in queue)" 
             max_players = 50  # Default, should be updated from server config
             if queue_count > 0:
@@ -234,50 +416,61 @@ class ConnectionLifecycleParser:
 
             # Update channel name if different
             if voice_channel.name != new_name:
-                await voice_channel.edit(name=new_name)
+                try:
+                    await voice_channel.edit(name=new_name)
+                except discord.NotFound:
+                    self._vc_cache.pop(server_key, None)
+                    logger.warning(f"Voice channel {voice_channel_id} was deleted in guild {guild_id}")
+                    return
                 logger.info(f"🔊 Updated voice channel: {new_name}")
                         
         except Exception as e:
             logger.error(f"Failed to update voice channels: {e}")
 
-    async def _create_join_embed(self, player_id: str, player_name: Optional[str] = None, server_key: str = None) -> Dict[str, Any]:
-        """Create themed embed for player join event"""
-        # Check for duplicate within last minute
-        if self._is_duplicate_connection(server_key, player_id, 'join'):
-            logger.debug(f"Blocking duplicate join message for {player_id}")
+    async def _resolve_voice_channel_target(self, guild_id: int, server_id: str) -> Optional[Tuple[int, str]]:
+        """Look up the playercountvc channel ID and server name from guild config"""
+        # Get guild configuration to find the configured playercountvc channel
+        if self.bot.db_manager is None:
+            logger.warning("Bot database not available for voice channel update")
             return None
-            
-        # Resolve player name if not provided - NEVER show player ID
-        resolved_name = await self._resolve_player_name(player_id, server_key)
-        display_name = resolved_name or player_name
-        
-        # If we still don't have a name, don't send the embed
-        if not display_name or display_name == player_id:
-            logger.warning(f"No player name resolved for ID {player_id}, skipping embed")
+
+        guild_config = await self.bot.db_manager.get_guild(guild_id)
+        if not guild_config:
             return None
-        
-        embed_data = {
-            'connection_id': display_name,
-            'timestamp': datetime.now(timezone.utc)
-        }
-        
-        embed, file_attachment = await EmbedFactory.build('player_join', embed_data)
-        result = {'type': 'player_connection', 'embed': embed, 'file': file_attachment}
-        
-        # Mark as sent to prevent duplicates
-        self._mark_connection_sent(server_key, player_id, 'join')
-        
-        # Send to connections channel if configured
-        if server_key:
-            await self._send_connection_embed(result, server_key)
-        
-        return result
+
+        # Look for playercountvc channel (set by /setchannel playercountvc command)
+        channels = guild_config.get('channels', {})
+        voice_channel_id = channels.get('playercountvc')
+
+        if not voice_channel_id:
+            logger.debug(f"No playercountvc channel configured for guild {guild_id}")
+            return None
+
+        # Get server name from guild config
+        server_config = await self.bot.db_manager.get_guild_server(guild_id, server_id)
+        server_name = server_config.get('name', f'Server {server_id}') if server_config else 'Unknown Server'
+
+        return voice_channel_id, server_name
+
+    def invalidate_voice_channel_cache(self, guild_id: int):
+        """Forget resolved voice channels for a guild (call after channel config changes)"""
+        prefix = f"{guild_id}_"
+        for server_key in [key for key in self._vc_cache if key.startswith(prefix)]:
+            del self._vc_cache[server_key]
+
+    async def _create_join_embed(self, player_id: str, player_name: Optional[str] = None, server_key: str = None) -> Dict[str, Any]:
+        """Create themed embed for player join event"""
+        return await self._create_connection_embed('join', player_id, player_name, server_key)
 
     async def _create_leave_embed(self, player_id: str, player_name: Optional[str] = None, server_key: str = None) -> Dict[str, Any]:
         """Create themed embed for player leave event"""
+        return await self._create_connection_embed('leave', player_id, player_name, server_key)
+
+    async def _create_connection_embed(self, event_type: str, player_id: str, player_name: Optional[str], server_key: Optional[str]) -> Dict[str, Any]:
+        """Create the join/leave embed; event_type is a CONNECTION_EMBEDS key"""
         # Check for duplicate within last minute
-        if self._is_duplicate_connection(server_key, player_id, 'leave'):
-            logger.debug(f"Blocking duplicate leave message for {player_id}")
+        if self._is_duplicate_connection(server_key, player_id, event_type):
+            logger.debug(f"Blocking duplicate {event_type} message for {player_id}")
             return None
             
         # Resolve player name if not provided - NEVER show player ID
@@ -294,11 +487,13 @@ class ConnectionLifecycleParser:
             'timestamp': datetime.now(timezone.utc)
         }
         
-        embed, file_attachment = await EmbedFactory.build('player_leave', embed_data)
-        result = {'type': 'player_disconnection', 'embed': embed, 'file': file_attachment}
+        # Title and status text are picked from EmbedFactory's class-level pools
+        embed_type, result_type = self.CONNECTION_EMBEDS[event_type]
+        embed, file_attachment = await EmbedFactory.build(embed_type, embed_data)
+        result = {'type': result_type, 'embed': embed, 'file': file_attachment}
         
         # Mark as sent to prevent duplicates
-        self._mark_connection_sent(server_key, player_id, 'leave')
+        self._mark_connection_sent(server_key, player_id, event_type)
         
         # Send to connections channel if configured
         if server_key:
@@ -313,7 +508,7 @@ class ConnectionLifecycleParser:
             guild_id = int(server_key.split('_')[0])
             
             # Get guild configuration
-            if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
+            if self.bot.db_manager is None:
                 logger.warning("Bot database not available for sending connection embeds")
                 return
 
@@ -359,8 +554,10 @@ class ConnectionLifecycleParser:
             del self.server_counts[server_key]
         if server_key in self.player_states:
             del self.player_states[server_key]
+            del self.event_counters[server_key]
         if server_key in self.player_names:
             del self.player_names[server_key]
+        self._last_activity.pop(server_key, None)
         logger.info(f"🔄 Reset player counts for server {server_key}")
 
     async def _resolve_player_name(self, player_id: str, server_key: str) -> Optional[str]:
@@ -376,7 +573,7 @@ class ConnectionLifecycleParser:
             server_id = parts[1] if len(parts) > 1 else 'unknown'
             
             # Search for player name in recent kill events
-            if hasattr(self.bot, 'db_manager') and self.bot.db_manager:
+            if self.bot.db_manager is not None:
                 # Look for recent kills/deaths involving this player ID
                 recent_kills = await self.bot.db_manager.get_recent_kills(guild_id, server_id, limit=100)
                 
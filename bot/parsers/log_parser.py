@@ -429,7 +429,7 @@ class LogParser:
     async def _get_guild_currency_name(self, guild_id: int) -> str:
         """Get custom currency name for guild or default"""
         try:
-            if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
+            if self.bot.db_manager is None:
                 return 'Emeralds'
             guild_config = await self.bot.db_manager.get_guild(guild_id)
             return guild_config.get('currency_name', 'Emeralds') if guild_config else 'Emeralds'
@@ -598,7 +598,7 @@ class LogParser:
             status = self.server_status[status_key]
 
             # Get guild config to find voice channel - FIX: Use proper database manager
-            if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
+            if self.bot.db_manager is None:
                 logger.warning("Bot database not available for voice channel update")
                 return
 
@@ -810,16 +810,21 @@ class LogParser:
             logger.error(f"Failed to read dev log file: {e}")
             return None
 
-    async def parse_log_line(self, line: str, server_key: str, guild_id: int) -> Optional[Dict[str, Any]]:
-        """Parse a single log line and extract event data with enhanced patterns"""
+    async def parse_log_line(self, line: str, server_key: str, guild_id: int, check_lifecycle: bool = True) -> Optional[Dict[str, Any]]:
+        """Parse a single log line and extract event data with enhanced patterns
+
+        Batch callers that already ran connection_parser.parse_lines pass
+        check_lifecycle=False so lifecycle events are not applied twice.
+        """
         line = line.strip()
         if not line:
             return None
         
         # FIRST: Check for player connection lifecycle events using new parser
-        lifecycle_result = await self.connection_parser.parse_lifecycle_event(line, server_key, guild_id)
-        if lifecycle_result:
-            return lifecycle_result
+        if check_lifecycle:
+            lifecycle_result = await self.connection_parser.parse_lifecycle_event(line, server_key, guild_id)
+            if lifecycle_result:
+                return lifecycle_result
 
         # Try each pattern - prioritize specific patterns over generic ones
         for event_type, pattern in self.log_patterns.items():
@@ -1112,7 +1117,7 @@ class LogParser:
                 return
 
             # Get guild configuration - FIX: Use proper database manager
-            if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
+            if self.bot.db_manager is None:
                 logger.warning("Bot database not available for sending embeds")
                 return
 
@@ -1362,9 +1367,10 @@ class LogParser:
             new_lines = lines[last_position:]
             new_events = 0
 
-            for line in new_lines:
-                server_key = self.get_server_status_key(guild_id, server_id)
-                event_data = await self.parse_log_line(line, server_key, guild_id)
+            lifecycle_results = await self.connection_parser.parse_lines(new_lines, server_key, guild_id)
+
+            for line, lifecycle_result in zip(new_lines, lifecycle_results):
+                event_data = lifecycle_result or await self.parse_log_line(line, server_key, guild_id, check_lifecycle=False)
                 if event_data:
                     # Process player tracking events
                     await self.process_log_event(guild_id, server_id, event_data)
@@ -1413,6 +1419,8 @@ class LogParser:
 
             logger.info(f"Starting enhanced batch processing: {len(lines)} lines in {total_batches} batches")
 
+            server_key = self.get_server_status_key(guild_id, server_id)
+
             for i in range(0, len(lines), batch_size):
                 batch = lines[i:i + batch_size]
                 batch_events = 0
@@ -1420,10 +1428,11 @@ class LogParser:
 
                 logger.debug(f"Processing batch {batch_number}/{total_batches} (lines {i+1}-{min(i+batch_size, len(lines))})")
 
-                for line_num, line in enumerate(batch, start=i+1):
+                lifecycle_results = await self.connection_parser.parse_lines(batch, server_key, guild_id)
+
+                for line_num, (line, lifecycle_result) in enumerate(zip(batch, lifecycle_results), start=i+1):
                     processed_lines += 1
-                    server_key = self.get_server_status_key(guild_id, server_id)
-                    event_data = await self.parse_log_line(line, server_key, guild_id)
+                    event_data = lifecycle_result or await self.parse_log_line(line, server_key, guild_id, check_lifecycle=False)
                     if event_data:
                         logger.debug(f"Line {line_num}: Parsed event: {event_data['type']}")
                         # Process player tracking events
@@ -1471,12 +1480,14 @@ class LogParser:
         """Process log content and extract events"""
         try:
             lines = content.splitlines()
-            for line in lines:
+            server_key = self.get_server_status_key(guild_id, server_id)
+            lifecycle_results = await self.connection_parser.parse_lines(lines, server_key, guild_id)
+
+            for line, lifecycle_result in zip(lines, lifecycle_results):
                 if not line.strip():
                     continue
 
-                server_key = self.get_server_status_key(guild_id, server_id)
-                event_data = await self.parse_log_line(line, server_key, guild_id)
+                event_data = lifecycle_result or await self.parse_log_line(line, server_key, guild_id, check_lifecycle=False)
                 if event_data:
                     # Process player tracking events
                     await self.process_log_event(guild_id, server_id, event_data)
@@ -1563,7 +1574,7 @@ class LogParser:
         try:
             logger.info("Starting enhanced log parser execution")
 
-            if not hasattr(self.bot, 'db_manager') or not self.bot.db_manager:
+            if self.bot.db_manager is None:
                 logger.error("Bot database not available for log parsing")
                 return
 
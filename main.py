@@ -126,6 +126,7 @@ class EmeraldKillfeedBot(commands.Bot):
         )
 
         # Initialize variables
+        self.mongo_client = None
         self.db_manager = None
         self.scheduler = AsyncIOScheduler()
         self.killfeed_parser = None
@@ -505,10 +506,10 @@ class EmeraldKillfeedBot(commands.Bot):
     async def cleanup_connections(self):
         """Clean up AsyncSSH connections on shutdown"""
         try:
-            if hasattr(self, 'killfeed_parser') and self.killfeed_parser:
+            if self.killfeed_parser is not None:
                 await self.killfeed_parser.cleanup_sftp_connections()
 
-            if hasattr(self, 'log_parser') and self.log_parser:
+            if self.log_parser is not None:
                 # Clean up log parser SFTP connections
                 for pool_key, conn in list(self.log_parser.sftp_pool.items()):
                     try:
@@ -684,7 +685,7 @@ class EmeraldKillfeedBot(commands.Bot):
             self.scheduler.shutdown()
             logger.info("Scheduler stopped")
 
-        if hasattr(self, 'mongo_client') and self.mongo_client:
+        if self.mongo_client is not None:
             self.mongo_client.close()
             logger.info("MongoDB connection closed")
 